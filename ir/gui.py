@@ -19,7 +19,7 @@
 
 from unicodedata import normalize
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QSignalBlocker, QStringListModel, Qt, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QButtonGroup,
@@ -48,11 +48,24 @@ from .util import (
     createSpinBox,
     getColorList,
     getFieldNames,
-    removeComboBoxItem,
     setComboBoxItem,
     setField,
 )
 
+KEYS = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789')
+KEYS_WITH_BLANK = [''] + KEYS
+MANDATORY_QUICK_KEY_FIELDS = ('extractDeck', 'modelName', 'regularKey')
+
+COLOR_PREVIEW_STYLE = (
+    'QLabel {'
+    'background-color: %s;'
+    'color: %s;'
+    'padding: 10px;'
+    'font-size: 16px;'
+    'font-family: tahoma, geneva, sans-serif;'
+    '}'
+)
+
 
 class SettingsDialog:
     altKeyCheckBox = None
@@ -69,7 +82,6 @@ class SettingsDialog:
     extractPercentButton = None
     extractRandomCheckBox = None
     extractValueEditBox = None
-    generalZoomSpinBox = None
     highlightKeyComboBox = None
     importDeckComboBox = None
     italicSeqEditBox = None
@@ -78,10 +90,8 @@ class SettingsDialog:
     laterValueEditBox = None
     limitAllCardsButton = None
     limitIrCardsButton = None
-    lineStepSpinBox = None
     noteTypeComboBox = None
     organizerFormatEditBox = None
-    pageStepSpinBox = None
     plainTextCheckBox = None
     prioButton = None
     quickKeyEditExtractCheckBox = None
@@ -98,6 +108,7 @@ class SettingsDialog:
     sourceFieldComboBox = None
     sourceFormatEditBox = None
     strikeSeqEditBox = None
+    tabWidget = None
     tagsEditBox = None
     targetComboBox = None
     textColorComboBox = None
@@ -105,7 +116,6 @@ class SettingsDialog:
     underlineSeqEditBox = None
     undoKeyComboBox = None
     widthEditBox = None
-    zoomStepSpinBox = None
 
     def __init__(self, settings):
         self.settings = settings
@@ -113,23 +123,35 @@ class SettingsDialog:
 
     def show(self):
         dialog = QDialog(mw)
-
-        zoomScrollLayout = QHBoxLayout()
-        zoomScrollLayout.addWidget(self._getZoomGroupBox())
-        zoomScrollLayout.addWidget(self._getScrollGroupBox())
-
-        zoomScrollTab = QWidget()
-        zoomScrollTab.setLayout(zoomScrollLayout)
-
-        tabWidget = QTabWidget()
-        tabWidget.setUsesScrollButtons(False)
-        tabWidget.addTab(self._getGeneralTab(), 'General')
-        tabWidget.addTab(self._getExtractionTab(), 'Extraction')
-        tabWidget.addTab(self._getHighlightTab(), 'Formatting')
-        tabWidget.addTab(self._getSchedulingTab(), 'Scheduling')
-        tabWidget.addTab(self._getImportingTab(), 'Importing')
-        tabWidget.addTab(self._getQuickKeysTab(), 'Quick Keys')
-        tabWidget.addTab(zoomScrollTab, 'Zoom / Scroll')
+        self._dialog = dialog
+
+        self._tabs = [
+            ('General', self._getGeneralTab, self._saveGeneralTab),
+            ('Extraction', self._getExtractionTab, self._saveExtractionTab),
+            ('Formatting', self._getHighlightTab, self._saveHighlightTab),
+            ('Scheduling', self._getSchedulingTab, self._saveSchedulingTab),
+            ('Importing', self._getImportingTab, self._saveImportingTab),
+            ('Quick Keys', self._getQuickKeysTab, None),
+            ('Zoom / Scroll', self._getZoomScrollTab, self._saveZoomScrollTab),
+        ]
+        self._builtTabs = set()
+        self._colorPreviewPending = False
+        self._quickKeysChanged = False
+        self._deckNames = None
+        self._fieldNames = {}
+        self._textFieldNames = None
+
+        self.tabWidget = QTabWidget()
+        self.tabWidget.setUsesScrollButtons(False)
+        for title, _, _ in self._tabs:
+            placeholderLayout = QVBoxLayout()
+            placeholderLayout.setContentsMargins(0, 0, 0, 0)
+            placeholder = QWidget()
+            placeholder.setLayout(placeholderLayout)
+            self.tabWidget.addTab(placeholder, title)
+
+        self._buildTab(self.tabWidget.currentIndex())
+        self.tabWidget.currentChanged.connect(self._buildTab)
 
         buttonBox = QDialogButtonBox(
             QDialogButtonBox.StandardButton.Close | QDialogButtonBox.StandardButton.Save
@@ -139,7 +161,7 @@ class SettingsDialog:
         buttonBox.setOrientation(Qt.Orientation.Horizontal)
 
         mainLayout = QVBoxLayout()
-        mainLayout.addWidget(tabWidget)
+        mainLayout.addWidget(self.tabWidget)
         mainLayout.addWidget(buttonBox)
 
         dialog.setLayout(mainLayout)
@@ -152,18 +174,70 @@ class SettingsDialog:
             else:
                 done = True
 
+        if self._quickKeysChanged:
+            self.settings.loadMenuItems()
+
+        self.settings.save()
+
+    def _buildTab(self, index):
+        if index < 0 or index in self._builtTabs:
+            return
+
+        self._builtTabs.add(index)
+        _, getTab, _ = self._tabs[index]
+        placeholder = self.tabWidget.widget(index)
+        placeholder.setUpdatesEnabled(False)
+        placeholder.layout().addWidget(getTab())
+        placeholder.setUpdatesEnabled(True)
+
+    def _getDeckNames(self):
+        if self._deckNames is None:
+            self._deckNames = sorted(
+                d.name for d in mw.col.decks.all_names_and_ids()
+            )
+        return self._deckNames
+
+    def _getFieldNames(self, modelName):
+        if modelName not in self._fieldNames:
+            self._fieldNames[modelName] = getFieldNames(modelName)
+        return self._fieldNames[modelName]
+
     def _saveChanges(self):
-        self._saveHighlightSettings()
+        self._warnings = []
+        done = True
+        for index in sorted(self._builtTabs):
+            _, _, saveTab = self._tabs[index]
+            if saveTab and not saveTab():
+                done = False
+
+        for warning in dict.fromkeys(self._warnings):
+            showWarning(warning)
+
+        mw.readingManager.viewManager.resetZoom(mw.state)
+        return done
+
+    def _saveGeneralTab(self):
         done = self._saveKeys()
 
-        self.settings['zoomStep'] = self.zoomStepSpinBox.value() / 100.0
-        self.settings['generalZoom'] = self.generalZoomSpinBox.value() / 100.0
-        self.settings['lineScrollFactor'] = (
-            self.lineStepSpinBox.value() / 100.0
-        )
-        self.settings['pageScrollFactor'] = (
-            self.pageStepSpinBox.value() / 100.0
-        )
+        try:
+            self.settings['maxWidth'] = int(self.widthEditBox.text())
+        except ValueError:
+            self._warnings.append('Integer value expected. Please try again.')
+            done = False
+
+        if self.limitAllCardsButton.isChecked():
+            self.settings['limitWidth'] = True
+            self.settings['limitWidthAll'] = True
+        elif self.limitIrCardsButton.isChecked():
+            self.settings['limitWidth'] = True
+            self.settings['limitWidthAll'] = False
+        else:
+            self.settings['limitWidth'] = False
+            self.settings['limitWidthAll'] = False
+
+        return done
+
+    def _saveExtractionTab(self):
         self.settings['editExtract'] = self.editExtractButton.isChecked()
         self.settings['editSource'] = self.editSourceCheckBox.isChecked()
         self.settings['plainText'] = self.plainTextCheckBox.isChecked()
@@ -171,9 +245,6 @@ class SettingsDialog:
         self.settings[
             'scheduleExtract'
         ] = self.scheduleExtractCheckBox.isChecked()
-        self.settings['soonRandom'] = self.soonRandomCheckBox.isChecked()
-        self.settings['laterRandom'] = self.laterRandomCheckBox.isChecked()
-        self.settings['extractRandom'] = self.extractRandomCheckBox.isChecked()
 
         if self.extractDeckComboBox.currentText() == '[Current Deck]':
             self.settings['extractDeck'] = None
@@ -182,77 +253,92 @@ class SettingsDialog:
                 'extractDeck'
             ] = self.extractDeckComboBox.currentText()
 
+        return True
+
+    def _saveHighlightTab(self):
+        self._saveHighlightSettings()
+
+        self.settings['boldSeq'] = self.boldSeqEditBox.keySequence().toString()
+        self.settings[
+            'italicSeq'
+        ] = self.italicSeqEditBox.keySequence().toString()
+        self.settings[
+            'underlineSeq'
+        ] = self.underlineSeqEditBox.keySequence().toString()
+        self.settings[
+            'strikeSeq'
+        ] = self.strikeSeqEditBox.keySequence().toString()
+
+        return True
+
+    def _saveSchedulingTab(self):
+        done = True
+
+        for key, checkBox in [
+            ('soonRandom', self.soonRandomCheckBox),
+            ('laterRandom', self.laterRandomCheckBox),
+            ('extractRandom', self.extractRandomCheckBox),
+        ]:
+            self.settings[key] = checkBox.isChecked()
+
         try:
-            self.settings['soonValue'] = int(self.soonValueEditBox.text())
-            self.settings['laterValue'] = int(self.laterValueEditBox.text())
-            self.settings['extractValue'] = int(
-                self.extractValueEditBox.text()
-            )
-            self.settings['maxWidth'] = int(self.widthEditBox.text())
+            values = {
+                key: int(editBox.text())
+                for key, editBox in [
+                    ('soonValue', self.soonValueEditBox),
+                    ('laterValue', self.laterValueEditBox),
+                    ('extractValue', self.extractValueEditBox),
+                ]
+            }
         except ValueError:
-            showWarning('Integer value expected. Please try again.')
+            self._warnings.append('Integer value expected. Please try again.')
             done = False
-
-        if self.importDeckComboBox.currentText() == '[Current Deck]':
-            self.settings['importDeck'] = None
         else:
-            self.settings['importDeck'] = self.importDeckComboBox.currentText()
+            for key, value in values.items():
+                self.settings[key] = value
 
         if self.settings['prioEnabled'] != self.prioButton.isChecked():
             self.settings['prioEnabled'] = self.prioButton.isChecked()
             self._addPrioFields()
 
-        if self.soonPercentButton.isChecked():
-            self.settings['soonMethod'] = 'percent'
-        else:
-            self.settings['soonMethod'] = 'count'
+        for key, percentButton in [
+            ('soonMethod', self.soonPercentButton),
+            ('laterMethod', self.laterPercentButton),
+            ('extractMethod', self.extractPercentButton),
+        ]:
+            if percentButton.isChecked():
+                self.settings[key] = 'percent'
+            else:
+                self.settings[key] = 'count'
 
-        if self.laterPercentButton.isChecked():
-            self.settings['laterMethod'] = 'percent'
-        else:
-            self.settings['laterMethod'] = 'count'
+        if not self._saveFormat(
+            'organizerFormat', self.organizerFormatEditBox
+        ):
+            done = False
 
-        if self.extractPercentButton.isChecked():
-            self.settings['extractMethod'] = 'percent'
+        return done
+
+    def _saveImportingTab(self):
+        if self.importDeckComboBox.currentText() == '[Current Deck]':
+            self.settings['importDeck'] = None
         else:
-            self.settings['extractMethod'] = 'count'
+            self.settings['importDeck'] = self.importDeckComboBox.currentText()
 
-        d = {
-            'organizerFormat': self.organizerFormatEditBox,
-            'sourceFormat': self.sourceFormatEditBox,
-        }
-        for name, editBox in d.items():
-            fmt = editBox.text().replace(r'\t', '\t')
-            if self.settings.validFormat(name, fmt):
-                self.settings[name] = fmt
-            else:
-                showWarning('Missing required keys for format string.')
-                done = False
-                break
+        return self._saveFormat('sourceFormat', self.sourceFormatEditBox)
 
-        if self.limitAllCardsButton.isChecked():
-            self.settings['limitWidth'] = True
-            self.settings['limitWidthAll'] = True
-        elif self.limitIrCardsButton.isChecked():
-            self.settings['limitWidth'] = True
-            self.settings['limitWidthAll'] = False
-        else:
-            self.settings['limitWidth'] = False
-            self.settings['limitWidthAll'] = False
+    def _saveFormat(self, name, editBox):
+        fmt = editBox.text().replace(r'\t', '\t')
+        if self.settings.validFormat(name, fmt):
+            self.settings[name] = fmt
+            return True
 
-        self.settings['boldSeq'] = self.boldSeqEditBox.keySequence().toString()
-        self.settings[
-            'italicSeq'
-        ] = self.italicSeqEditBox.keySequence().toString()
-        self.settings[
-            'underlineSeq'
-        ] = self.underlineSeqEditBox.keySequence().toString()
-        self.settings[
-            'strikeSeq'
-        ] = self.strikeSeqEditBox.keySequence().toString()
+        self._warnings.append('Missing required keys for format string.')
+        return False
 
-        mw.readingManager.viewManager.resetZoom(mw.state)
-        return done
+    def _saveZoomScrollTab(self):
+        for key, spinBox in self._spinBoxes.items():
+            self.settings[key] = spinBox.value() / 100.0
+        return True
 
     def _addPrioFields(self):
         model = mw.col.models.by_name(self.settings['modelName'])
@@ -262,6 +348,7 @@ class SettingsDialog:
             return
         field = mw.col.models.new_field(self.settings['prioField'])
         mw.col.models.add_field(model, field)
+        self._fieldNames.pop(self.settings['modelName'], None)
         for (nid,) in mw.col.db.execute(
             'SELECT id FROM notes WHERE mid = ?', model['id']
         ):
@@ -288,14 +375,14 @@ class SettingsDialog:
         self.removeKeyComboBox = QComboBox()
         self.undoKeyComboBox = QComboBox()
 
-        keys = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789')
+        keyModel = QStringListModel(KEYS, self.highlightKeyComboBox)
         for comboBox in [
             self.highlightKeyComboBox,
             self.extractKeyComboBox,
             self.removeKeyComboBox,
             self.undoKeyComboBox,
         ]:
-            comboBox.addItems(keys)
+            comboBox.setModel(keyModel)
 
         self._setCurrentKeys()
 
@@ -385,10 +472,13 @@ class SettingsDialog:
 
     def _saveKeys(self):
         keys = [
-            self.highlightKeyComboBox.currentText(),
-            self.extractKeyComboBox.currentText(),
-            self.removeKeyComboBox.currentText(),
-            self.undoKeyComboBox.currentText(),
+            comboBox.currentText().lower()
+            for comboBox in [
+                self.highlightKeyComboBox,
+                self.extractKeyComboBox,
+                self.removeKeyComboBox,
+                self.undoKeyComboBox,
+            ]
         ]
 
         if len(set(keys)) < len(keys):
@@ -399,23 +489,17 @@ class SettingsDialog:
             self._setCurrentKeys()
             return False
 
-        self.settings[
-            'highlightKey'
-        ] = self.highlightKeyComboBox.currentText().lower()
-        self.settings[
-            'extractKey'
-        ] = self.extractKeyComboBox.currentText().lower()
-        self.settings[
-            'removeKey'
-        ] = self.removeKeyComboBox.currentText().lower()
-        self.settings['undoKey'] = self.undoKeyComboBox.currentText().lower()
+        for name, key in zip(
+            ['highlightKey', 'extractKey', 'removeKey', 'undoKey'], keys
+        ):
+            self.settings[name] = key
         return True
 
     def _getExtractionTab(self):
         extractDeckLabel = QLabel('Extracts Deck')
         self.extractDeckComboBox = QComboBox()
         self.extractDeckComboBox.setFixedWidth(400)
-        deckNames = sorted([d['name'] for d in mw.col.decks.all()])
+        deckNames = self._getDeckNames()
         self.extractDeckComboBox.addItem('[Current Deck]')
         self.extractDeckComboBox.addItems(deckNames)
 
@@ -508,17 +592,12 @@ class SettingsDialog:
             self.settings['quickKeys'][target]['extractTextColor'] = textColor
 
     def _getHighlightGroupBox(self):
-        self.targetComboBox = QComboBox()
-        self._populateTargetComboBox()
-        self.targetComboBox.currentIndexChanged.connect(
-            self._updateHighlightTab
-        )
-        targetLayout = QHBoxLayout()
-        targetLayout.addStretch()
+        self.colorPreviewLabel = QLabel('Example Text')
+        self.colorPreviewLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        colors = getColorList()
         self.bgColorComboBox = QComboBox()
-        self.bgColorComboBox.addItems(colors)
+        colorModel = QStringListModel(getColorList(), self.bgColorComboBox)
+        self.bgColorComboBox.setModel(colorModel)
         setComboBoxItem(
             self.bgColorComboBox, self.settings['highlightBgColor']
         )
@@ -527,7 +606,7 @@ class SettingsDialog:
         )
         self.bgColorComboBox.activated.connect(self._saveHighlightSettings)
         self.textColorComboBox = QComboBox()
-        self.textColorComboBox.addItems(colors)
+        self.textColorComboBox.setModel(colorModel)
         setComboBoxItem(
             self.textColorComboBox, self.settings['highlightTextColor']
         )
@@ -535,9 +614,16 @@ class SettingsDialog:
             self._updateColorPreview
         )
         self.textColorComboBox.activated.connect(self._saveHighlightSettings)
-        self.colorPreviewLabel = QLabel('Example Text')
         self._updateColorPreview()
 
+        self.targetComboBox = QComboBox()
+        self.targetComboBox.setModel(
+            QStringListModel(self._getTargetNames(), self.targetComboBox)
+        )
+        self.targetComboBox.currentIndexChanged.connect(
+            self._updateHighlightTab
+        )
+
         bgColorLabel = QLabel('Background')
         bgColorLayout = QHBoxLayout()
         bgColorLayout.addWidget(bgColorLabel)
@@ -562,11 +648,31 @@ class SettingsDialog:
 
         return groupBox
 
-    def _populateTargetComboBox(self):
-        self.targetComboBox.clear()
-        self.targetComboBox.addItem('[Highlight Key]')
-        self.targetComboBox.addItem('[Extract Key]')
-        self.targetComboBox.addItems(self.settings['quickKeys'].keys())
+    def _getTargetNames(self):
+        return ['[Highlight Key]', '[Extract Key]'] + sorted(
+            self.settings['quickKeys']
+        )
+
+    def _getQuickKeyNames(self):
+        return [''] + sorted(self.settings['quickKeys'])
+
+    def _updateQuickKeyNames(self):
+        if self.quickKeysComboBox is not None:
+            with QSignalBlocker(self.quickKeysComboBox):
+                self.quickKeysComboBox.model().setStringList(
+                    self._getQuickKeyNames()
+                )
+
+        if self.targetComboBox is not None:
+            self.targetComboBox.model().setStringList(self._getTargetNames())
+
+    def _removeQuickKeyName(self, row):
+        with QSignalBlocker(self.quickKeysComboBox):
+            self.quickKeysComboBox.model().removeRows(row, 1)
+
+        if self.targetComboBox is not None:
+            # Same sorted names, after two fixed entries instead of one
+            self.targetComboBox.model().removeRows(row + 1, 1)
 
     def _updateHighlightTab(self):
         target = self.targetComboBox.currentText()
@@ -575,43 +681,37 @@ class SettingsDialog:
             return
 
         if target == '[Highlight Key]':
-            setComboBoxItem(
-                self.bgColorComboBox, self.settings['highlightBgColor']
-            )
-            setComboBoxItem(
-                self.textColorComboBox, self.settings['highlightTextColor']
-            )
+            bgColor = self.settings['highlightBgColor']
+            textColor = self.settings['highlightTextColor']
         elif target == '[Extract Key]':
-            setComboBoxItem(
-                self.bgColorComboBox, self.settings['extractBgColor']
-            )
-            setComboBoxItem(
-                self.textColorComboBox, self.settings['extractTextColor']
-            )
+            bgColor = self.settings['extractBgColor']
+            textColor = self.settings['extractTextColor']
         else:
-            setComboBoxItem(
-                self.bgColorComboBox,
-                self.settings['quickKeys'][target]['extractBgColor'],
-            )
-            setComboBoxItem(
-                self.textColorComboBox,
-                self.settings['quickKeys'][target]['extractTextColor'],
-            )
+            bgColor = self.settings['quickKeys'][target]['extractBgColor']
+            textColor = self.settings['quickKeys'][target]['extractTextColor']
+
+        with QSignalBlocker(self.bgColorComboBox), QSignalBlocker(
+            self.textColorComboBox
+        ):
+            setComboBoxItem(self.bgColorComboBox, bgColor)
+            setComboBoxItem(self.textColorComboBox, textColor)
+
+        self._updateColorPreview()
 
     def _updateColorPreview(self):
+        if self._colorPreviewPending:
+            return
+
+        self._colorPreviewPending = True
+        QTimer.singleShot(0, self._applyColorPreview)
+
+    def _applyColorPreview(self):
+        self._colorPreviewPending = False
         bgColor = self.bgColorComboBox.currentText()
         textColor = self.textColorComboBox.currentText()
-        styleSheet = (
-            'QLabel {'
-            'background-color: %s;'
-            'color: %s;'
-            'padding: 10px;'
-            'font-size: 16px;'
-            'font-family: tahoma, geneva, sans-serif;'
-            '}'
-        ) % (bgColor, textColor)
-        self.colorPreviewLabel.setStyleSheet(styleSheet)
-        self.colorPreviewLabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.colorPreviewLabel.setStyleSheet(
+            COLOR_PREVIEW_STYLE % (bgColor, textColor)
+        )
 
     def _getStylingGroupBox(self):
         boldLabel = QLabel('Bold')
@@ -797,8 +897,9 @@ class SettingsDialog:
         keyComboLabel = QLabel('Key Combination')
 
         self.quickKeysComboBox = QComboBox()
-        self.quickKeysComboBox.addItem('')
-        self.quickKeysComboBox.addItems(self.settings['quickKeys'].keys())
+        self.quickKeysComboBox.setModel(
+            QStringListModel(self._getQuickKeyNames(), self.quickKeysComboBox)
+        )
         self.quickKeysComboBox.currentIndexChanged.connect(
             self._updateQuickKeysTab
         )
@@ -819,10 +920,24 @@ class SettingsDialog:
         self.altKeyCheckBox = QCheckBox('Alt')
         self.shiftKeyCheckBox = QCheckBox('Shift')
         self.regularKeyComboBox = QComboBox()
-        self.regularKeyComboBox.addItem('')
-        self.regularKeyComboBox.addItems(
-            list('ABCDEFGHIJKLMNOPQRSTUVWXYZ123456789')
-        )
+        self.regularKeyComboBox.addItems(KEYS_WITH_BLANK)
+
+        # Field lists depend on the note type, so it must be set first
+        self._quickKeyComboBoxes = {
+            'extractDeck': self.destDeckComboBox,
+            'modelName': self.noteTypeComboBox,
+            'textField': self.textFieldComboBox,
+            'sourceField': self.sourceFieldComboBox,
+            'regularKey': self.regularKeyComboBox,
+        }
+        self._quickKeyCheckBoxes = {
+            'ctrl': self.ctrlKeyCheckBox,
+            'alt': self.altKeyCheckBox,
+            'shift': self.shiftKeyCheckBox,
+            'editExtract': self.quickKeyEditExtractCheckBox,
+            'editSource': self.quickKeyEditSourceCheckBox,
+            'plainText': self.quickKeyPlainTextCheckBox,
+        }
 
         destDeckLayout = QHBoxLayout()
         destDeckLayout.addWidget(destDeckLabel)
@@ -848,11 +963,11 @@ class SettingsDialog:
         keyComboLayout.addWidget(self.shiftKeyCheckBox)
         keyComboLayout.addWidget(self.regularKeyComboBox)
 
-        deckNames = sorted([d['name'] for d in mw.col.decks.all()])
+        deckNames = self._getDeckNames()
         self.destDeckComboBox.addItem('')
         self.destDeckComboBox.addItems(deckNames)
 
-        modelNames = sorted([m['name'] for m in mw.col.models.all()])
+        modelNames = sorted(m.name for m in mw.col.models.all_names_and_ids())
         self.noteTypeComboBox.addItem('')
         self.noteTypeComboBox.addItems(modelNames)
         self.noteTypeComboBox.currentIndexChanged.connect(
@@ -901,27 +1016,23 @@ class SettingsDialog:
         keyCombo = self.quickKeysComboBox.currentText()
         if keyCombo:
             settings = self.settings['quickKeys'][keyCombo]
-            setComboBoxItem(self.destDeckComboBox, settings['extractDeck'])
-            setComboBoxItem(self.noteTypeComboBox, settings['modelName'])
-            setComboBoxItem(self.textFieldComboBox, settings['textField'])
-            setComboBoxItem(self.sourceFieldComboBox, settings['sourceField'])
-            self.ctrlKeyCheckBox.setChecked(settings['ctrl'])
-            self.altKeyCheckBox.setChecked(settings['alt'])
-            self.shiftKeyCheckBox.setChecked(settings['shift'])
-            setComboBoxItem(self.regularKeyComboBox, settings['regularKey'])
-            self.quickKeyEditExtractCheckBox.setChecked(
-                settings['editExtract']
-            )
-            self.quickKeyEditSourceCheckBox.setChecked(settings['editSource'])
-            self.quickKeyPlainTextCheckBox.setChecked(settings['plainText'])
+            for k, comboBox in self._quickKeyComboBoxes.items():
+                setComboBoxItem(comboBox, settings[k])
+            for k, checkBox in self._quickKeyCheckBoxes.items():
+                checkBox.setChecked(settings[k])
             self.tagsEditBox.setText(mw.col.tags.join(settings['tags']))
         else:
             self._clearQuickKeysTab()
 
     def _updateFieldLists(self):
-        self.textFieldComboBox.clear()
-        modelName = self.noteTypeComboBox.currentText()
-        self.textFieldComboBox.addItems(getFieldNames(modelName))
+        fieldNames = self._getFieldNames(self.noteTypeComboBox.currentText())
+        if fieldNames == self._textFieldNames:
+            return
+
+        with QSignalBlocker(self.textFieldComboBox):
+            self.textFieldComboBox.clear()
+            self.textFieldComboBox.addItems(fieldNames)
+        self._textFieldNames = fieldNames
         self._updateSourceFieldComboBox()
 
     def _updateSourceFieldComboBox(self):
@@ -929,152 +1040,137 @@ class SettingsDialog:
         modelName = self.noteTypeComboBox.currentText()
         fieldNames = [
             f
-            for f in getFieldNames(modelName)
+            for f in self._getFieldNames(modelName)
             if f != self.textFieldComboBox.currentText()
         ]
         self.sourceFieldComboBox.addItem('')
         self.sourceFieldComboBox.addItems(fieldNames)
 
     def _clearQuickKeysTab(self):
+        blockers = [
+            QSignalBlocker(comboBox)
+            for comboBox in [
+                self.quickKeysComboBox,
+                self.noteTypeComboBox,
+                self.textFieldComboBox,
+            ]
+        ]
+
         self.quickKeysComboBox.setCurrentIndex(0)
-        self.destDeckComboBox.setCurrentIndex(0)
-        self.noteTypeComboBox.setCurrentIndex(0)
-        self.textFieldComboBox.setCurrentIndex(0)
-        self.sourceFieldComboBox.setCurrentIndex(0)
-        self.ctrlKeyCheckBox.setChecked(False)
-        self.altKeyCheckBox.setChecked(False)
-        self.shiftKeyCheckBox.setChecked(False)
-        self.regularKeyComboBox.setCurrentIndex(0)
-        self.quickKeyEditExtractCheckBox.setChecked(False)
-        self.quickKeyEditSourceCheckBox.setChecked(False)
-        self.quickKeyPlainTextCheckBox.setChecked(False)
+        for comboBox in self._quickKeyComboBoxes.values():
+            comboBox.setCurrentIndex(0)
+        for checkBox in self._quickKeyCheckBoxes.values():
+            checkBox.setChecked(False)
         self.tagsEditBox.clear()
 
+        for blocker in blockers:
+            blocker.unblock()
+
+        self._updateFieldLists()
+
     def _unsetQuickKey(self):
         keyCombo = self.quickKeysComboBox.currentText()
         if keyCombo:
             self.settings['quickKeys'].pop(keyCombo)
-            removeComboBoxItem(self.quickKeysComboBox, keyCombo)
+            self._removeQuickKeyName(self.quickKeysComboBox.currentIndex())
             self._clearQuickKeysTab()
-            self._populateTargetComboBox()
-            self.settings.loadMenuItems()
+            self._quickKeysChanged = True
 
     def _setQuickKey(self):
         tags = mw.col.tags.canonify(
             mw.col.tags.split(normalize('NFC', self.tagsEditBox.text()))
         )
 
-        settings = {
-            'alt': self.altKeyCheckBox.isChecked(),
-            'ctrl': self.ctrlKeyCheckBox.isChecked(),
-            'editExtract': self.quickKeyEditExtractCheckBox.isChecked(),
-            'editSource': self.quickKeyEditSourceCheckBox.isChecked(),
-            'extractBgColor': self.bgColorComboBox.currentText(),
-            'extractDeck': self.destDeckComboBox.currentText(),
-            'extractTextColor': self.textColorComboBox.currentText(),
-            'isQuickKey': True,
-            'modelName': self.noteTypeComboBox.currentText(),
-            'plainText': self.quickKeyPlainTextCheckBox.isChecked(),
-            'regularKey': self.regularKeyComboBox.currentText(),
-            'shift': self.shiftKeyCheckBox.isChecked(),
-            'sourceField': self.sourceFieldComboBox.currentText(),
-            'tags': tags,
-            'textField': self.textFieldComboBox.currentText(),
-        }
+        settings = {'isQuickKey': True, 'tags': tags}
+        for k, comboBox in self._quickKeyComboBoxes.items():
+            settings[k] = comboBox.currentText()
+        for k, checkBox in self._quickKeyCheckBoxes.items():
+            settings[k] = checkBox.isChecked()
 
-        for k in ['extractDeck', 'modelName', 'regularKey']:
-            if not settings[k]:
-                showInfo(
-                    'Please complete all settings. Destination deck, '
-                    'note type, and a letter or number for the key '
-                    'combination are required.'
-                )
-                return
+        if not all(settings[k] for k in MANDATORY_QUICK_KEY_FIELDS):
+            showInfo(
+                'Please complete all settings. Destination deck, '
+                'note type, and a letter or number for the key '
+                'combination are required.'
+            )
+            return
 
-        keyCombo = ''
-        if settings['ctrl']:
-            keyCombo += 'Ctrl+'
-        if settings['alt']:
-            keyCombo += 'Alt+'
-        if settings['shift']:
-            keyCombo += 'Shift+'
-        keyCombo += settings['regularKey']
+        keyCombo = ''.join(
+            [
+                'Ctrl+' if settings['ctrl'] else '',
+                'Alt+' if settings['alt'] else '',
+                'Shift+' if settings['shift'] else '',
+                settings['regularKey'],
+            ]
+        )
+
+        if self.bgColorComboBox is not None:
+            bgColor = self.bgColorComboBox.currentText()
+            textColor = self.textColorComboBox.currentText()
+        else:
+            # Formatting tab not built; use the colours it would show first
+            bgColor = self.settings['highlightBgColor']
+            textColor = self.settings['highlightTextColor']
+
+        settings['extractBgColor'] = bgColor
+        settings['extractTextColor'] = textColor
 
         if keyCombo in self.settings['quickKeys']:
-            tooltip('Shortcut updated')
+            self.settings['quickKeys'][keyCombo] = settings
+            tooltip('Shortcut updated', parent=self._dialog)
         else:
-            self.quickKeysComboBox.addItem(keyCombo)
-            tooltip('New shortcut added: %s' % keyCombo)
+            self.settings['quickKeys'][keyCombo] = settings
+            self._updateQuickKeyNames()
+            tooltip(f'New shortcut added: {keyCombo}', parent=self._dialog)
 
-        self.settings['quickKeys'][keyCombo] = settings
         setComboBoxItem(self.quickKeysComboBox, keyCombo)
-        self._populateTargetComboBox()
-        self.settings.loadMenuItems()
-
-    def _getZoomGroupBox(self):
-        zoomStepLabel = QLabel('Zoom Step')
-        zoomStepPercentLabel = QLabel('%')
-        generalZoomLabel = QLabel('General Zoom')
-        generalZoomPercentLabel = QLabel('%')
-
-        zoomStepPercent = round(self.settings['zoomStep'] * 100)
-        generalZoomPercent = round(self.settings['generalZoom'] * 100)
-        self.zoomStepSpinBox = createSpinBox(zoomStepPercent, 5, 100, 5)
-        self.generalZoomSpinBox = createSpinBox(
-            generalZoomPercent, 10, 200, 10
+        self._quickKeysChanged = True
+
+    def _getZoomScrollTab(self):
+        self._spinBoxes = {}
+
+        zoomGroupBox = self._getSpinBoxGroupBox(
+            'Zoom',
+            [
+                ('Zoom Step', 'zoomStep', 5, 100, 5),
+                ('General Zoom', 'generalZoom', 10, 200, 10),
+            ],
+        )
+        scrollGroupBox = self._getSpinBoxGroupBox(
+            'Scroll',
+            [
+                ('Line Step', 'lineScrollFactor', 5, 100, 5),
+                ('Page Step', 'pageScrollFactor', 5, 100, 5),
+            ],
         )
 
-        zoomStepLayout = QHBoxLayout()
-        zoomStepLayout.addWidget(zoomStepLabel)
-        zoomStepLayout.addStretch()
-        zoomStepLayout.addWidget(self.zoomStepSpinBox)
-        zoomStepLayout.addWidget(zoomStepPercentLabel)
+        layout = QHBoxLayout()
+        layout.addWidget(zoomGroupBox)
+        layout.addWidget(scrollGroupBox)
 
-        generalZoomLayout = QHBoxLayout()
-        generalZoomLayout.addWidget(generalZoomLabel)
-        generalZoomLayout.addStretch()
-        generalZoomLayout.addWidget(self.generalZoomSpinBox)
-        generalZoomLayout.addWidget(generalZoomPercentLabel)
+        tab = QWidget()
+        tab.setLayout(layout)
 
-        layout = QVBoxLayout()
-        layout.addLayout(zoomStepLayout)
-        layout.addLayout(generalZoomLayout)
-        layout.addStretch()
+        return tab
 
-        groupBox = QGroupBox('Zoom')
-        groupBox.setLayout(layout)
+    def _getSpinBoxGroupBox(self, title, rows):
+        settings = self.settings
+        layout = QVBoxLayout()
 
-        return groupBox
+        for text, key, minimum, maximum, step in rows:
+            percent = round(settings[key] * 100)
+            spinBox = createSpinBox(percent, minimum, maximum, step, ' %')
+            self._spinBoxes[key] = spinBox
 
-    def _getScrollGroupBox(self):
-        lineStepLabel = QLabel('Line Step')
-        lineStepPercentLabel = QLabel('%')
-        pageStepLabel = QLabel('Page Step')
-        pageStepPercentLabel = QLabel('%')
-
-        lineStepPercent = round(self.settings['lineScrollFactor'] * 100)
-        pageStepPercent = round(self.settings['pageScrollFactor'] * 100)
-        self.lineStepSpinBox = createSpinBox(lineStepPercent, 5, 100, 5)
-        self.pageStepSpinBox = createSpinBox(pageStepPercent, 5, 100, 5)
-
-        lineStepLayout = QHBoxLayout()
-        lineStepLayout.addWidget(lineStepLabel)
-        lineStepLayout.addStretch()
-        lineStepLayout.addWidget(self.lineStepSpinBox)
-        lineStepLayout.addWidget(lineStepPercentLabel)
-
-        pageStepLayout = QHBoxLayout()
-        pageStepLayout.addWidget(pageStepLabel)
-        pageStepLayout.addStretch()
-        pageStepLayout.addWidget(self.pageStepSpinBox)
-        pageStepLayout.addWidget(pageStepPercentLabel)
+            rowLayout = QHBoxLayout()
+            rowLayout.addWidget(QLabel(text))
+            rowLayout.addStretch()
+            rowLayout.addWidget(spinBox)
+            layout.addLayout(rowLayout)
 
-        layout = QVBoxLayout()
-        layout.addLayout(lineStepLayout)
-        layout.addLayout(pageStepLayout)
         layout.addStretch()
 
-        groupBox = QGroupBox('Scroll')
+        groupBox = QGroupBox(title)
         groupBox.setLayout(layout)
 
         return groupBox
@@ -1083,7 +1179,7 @@ class SettingsDialog:
         importDeckLabel = QLabel('Imports Deck')
         self.importDeckComboBox = QComboBox()
         self.importDeckComboBox.setFixedWidth(400)
-        deckNames = sorted([d['name'] for d in mw.col.decks.all()])
+        deckNames = self._getDeckNames()
         self.importDeckComboBox.addItem('[Current Deck]')
         self.importDeckComboBox.addItems(deckNames)
 
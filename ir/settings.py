@@ -14,6 +14,7 @@
 # OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
 # PERFORMANCE OF THIS SOFTWARE.
 
+from copy import deepcopy
 from functools import partial
 import json
 import os
@@ -22,6 +23,16 @@ from anki.hooks import addHook
 from aqt import mw
 from aqt.utils import showInfo
 
+try:
+    from orjson import dumps as dumpJson, loads as loadJson
+except ImportError:
+    loadJson = json.loads
+
+    def dumpJson(obj):
+        return json.dumps(
+            obj, separators=(',', ':'), ensure_ascii=False
+        ).encode('utf-8')
+
 from ._version import __version__
 from .about import IR_GITHUB_URL
 from .util import addMenuItem, setMenuVisibility, updateModificationTime
@@ -34,6 +45,24 @@ class SettingsManager:
         'sourceFormat': ['url', 'date'],
     }
     doNotUpdate = ['feedLog', 'modified', 'quickKeys', 'scroll', 'zoom']
+    requiredQuickKeySettings = frozenset(
+        [
+            'alt',
+            'ctrl',
+            'editExtract',
+            'editSource',
+            'extractBgColor',
+            'extractDeck',
+            'extractTextColor',
+            'isQuickKey',
+            'modelName',
+            'regularKey',
+            'shift',
+            'sourceField',
+            'tags',
+            'textField',
+        ]
+    )
     defaults = {
         'badTags': ['iframe', 'script'],
         'boldSeq': 'Ctrl+B',
@@ -110,17 +139,20 @@ class SettingsManager:
         return self.settings[key]
 
     def load(self):
+        self._savedJson = None
+
         if os.path.isfile(self.getSettingsPath()):
             self._loadExisting()
         else:
-            self.settings = self.defaults
+            self.settings = deepcopy(self.defaults)
 
         if self.updated:
             showInfo('Your Incremental Reading settings have been updated.')
 
     def _loadExisting(self):
-        with open(self.getSettingsPath(), encoding='utf-8') as jsonFile:
-            self.settings = json.load(jsonFile)
+        with open(self.getSettingsPath(), 'rb') as jsonFile:
+            self._savedJson = jsonFile.read()
+        self.settings = loadJson(self._savedJson)
         self._update()
 
     def getSettingsPath(self):
@@ -137,35 +169,21 @@ class SettingsManager:
         self._validateFormatStrings()
 
     def _addMissing(self):
-        for k, v in self.defaults.items():
-            if k not in self.settings:
-                self.settings[k] = v
-                self.updated = True
+        missing = self.defaults.keys() - self.settings.keys()
+        if not missing:
+            return
 
-    def _removeOutdated(self):
-        required = [
-            'alt',
-            'ctrl',
-            'editExtract',
-            'editSource',
-            'extractBgColor',
-            'extractDeck',
-            'extractTextColor',
-            'isQuickKey',
-            'modelName',
-            'regularKey',
-            'shift',
-            'sourceField',
-            'tags',
-            'textField',
-        ]
+        for k in self.defaults:
+            if k in missing:
+                self.settings[k] = deepcopy(self.defaults[k])
+        self.updated = True
 
-        for keyCombo, settings in self.settings['quickKeys'].copy().items():
-            for k in required:
-                if k not in settings:
-                    self.settings['quickKeys'].pop(keyCombo)
-                    self.updated = True
-                    break
+    def _removeOutdated(self):
+        quickKeys = self.settings['quickKeys']
+        for keyCombo in list(quickKeys):
+            if not self.requiredQuickKeySettings.issubset(quickKeys[keyCombo]):
+                quickKeys.pop(keyCombo)
+                self.updated = True
 
         outdated = [k for k in self.settings if k not in self.defaults]
         for k in outdated:
@@ -183,7 +201,7 @@ class SettingsManager:
             if self.settings[k] == self.defaults[k]:
                 continue
 
-            self.settings[k] = self.defaults[k]
+            self.settings[k] = deepcopy(self.defaults[k])
             self.updated = True
 
     def _validateFormatStrings(self):
@@ -205,9 +223,25 @@ class SettingsManager:
         self.save()
 
     def save(self):
-        with open(self.getSettingsPath(), 'w', encoding='utf-8') as jsonFile:
-            json.dump(self.settings, jsonFile)
-
+        settingsJson = dumpJson(self.settings)
+        if settingsJson == self._savedJson:
+            return
+
+        path = self.getSettingsPath()
+        tempPath = path + '.tmp'
+        try:
+            with open(tempPath, 'wb') as jsonFile:
+                jsonFile.write(settingsJson)
+                jsonFile.flush()
+                os.fsync(jsonFile.fileno())
+            os.replace(tempPath, path)
+        except OSError:
+            # Don't leave a partial file behind in the synced media folder
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+
+        self._savedJson = settingsJson
         updateModificationTime(self.getMediaDir())
 
     def loadMenuItems(self):
@@ -221,7 +255,12 @@ class SettingsManager:
                 settings['modelName'],
                 settings['extractDeck'],
             )
-            func = partial(mw.readingManager.textManager.extract, settings)
+            func = partial(self._extractQuickKey, keyCombo)
             addMenuItem(path, text, func, keyCombo)
 
         setMenuVisibility(path)
+
+    def _extractQuickKey(self, keyCombo):
+        mw.readingManager.textManager.extract(
+            self.settings['quickKeys'][keyCombo]
+        )
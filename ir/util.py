@@ -12,6 +12,7 @@
 # OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
 # PERFORMANCE OF THIS SOFTWARE.
 
+from functools import lru_cache
 import os
 import stat
 import time
@@ -72,24 +73,26 @@ def setMenuVisibility(path):
 
 
 def addMenuItem(path, text, function, keys=None):
-    action = QAction(text, mw)
-
-    if keys:
-        action.setShortcut(QKeySequence(keys))
-
-    action.triggered.connect(function)
-
     if path == 'File':
-        mw.form.menuCol.addAction(action)
+        menu = mw.form.menuCol
     elif path == 'Edit':
-        mw.form.menuEdit.addAction(action)
+        menu = mw.form.menuEdit
     elif path == 'Tools':
-        mw.form.menuTools.addAction(action)
+        menu = mw.form.menuTools
     elif path == 'Help':
-        mw.form.menuHelp.addAction(action)
+        menu = mw.form.menuHelp
     else:
         addMenu(path)
-        mw.customMenus[path].addAction(action)
+        menu = mw.customMenus[path]
+
+    # Owned by the menu, so that clearing the menu also deletes the action
+    action = QAction(text, menu)
+
+    if keys:
+        action.setShortcut(QKeySequence(keys))
+
+    action.triggered.connect(function)
+    menu.addAction(action)
 
 
 def getField(note, fieldName):
@@ -112,24 +115,22 @@ def getFieldNames(modelName):
     return mw.col.models.field_names(mw.col.models.by_name(modelName))
 
 
-def createSpinBox(value, minimum, maximum, step):
+def createSpinBox(value, minimum, maximum, step, suffix=''):
     spinBox = QSpinBox()
     spinBox.setRange(minimum, maximum)
     spinBox.setSingleStep(step)
+    spinBox.setSuffix(suffix)
     spinBox.setValue(value)
     return spinBox
 
 
 def setComboBoxItem(comboBox, text):
+    if comboBox.currentText() == text:
+        return
     index = comboBox.findText(text, Qt.MatchFlag.MatchFixedString)
     comboBox.setCurrentIndex(index)
 
 
-def removeComboBoxItem(comboBox, text):
-    index = comboBox.findText(text, Qt.MatchFlag.MatchFixedString)
-    comboBox.removeItem(index)
-
-
 def updateModificationTime(path):
     accessTime = os.stat(path)[stat.ST_ATIME]
     modificationTime = time.time()
@@ -152,6 +153,7 @@ def loadFile(fileDir, filename):
         return f.read()
 
 
+@lru_cache(maxsize=1)
 def getColorList():
     moduleDir, _ = os.path.split(__file__)
     colorsFilePath = os.path.join(moduleDir, 'data', 'colors.u8')
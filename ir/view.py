@@ -48,35 +48,31 @@ class ViewManager:
             self._setZoom(self._zoomFactor)
 
     def zoomIn(self):
-        if viewingIrText():
-            cid = str(mw.reviewer.card.id)
-
-            if cid not in self._settings['zoom']:
-                self._settings['zoom'][cid] = 1
-
-            self._settings['zoom'][cid] += self._settings['zoomStep']
-            mw.web.setZoomFactor(self._settings['zoom'][cid])
-        elif mw.state == 'review':
-            self._zoomFactor += self._settings['zoomStep']
-            mw.web.setZoomFactor(self._zoomFactor)
-        else:
-            self._settings['generalZoom'] += self._settings['zoomStep']
-            mw.web.setZoomFactor(self._settings['generalZoom'])
+        self._zoom(self._settings['zoomStep'])
 
     def zoomOut(self):
+        self._zoom(-self._settings['zoomStep'])
+
+    def _zoom(self, step):
+        # Keep factors at whole percentages; repeatedly adding float steps
+        # would otherwise accumulate rounding error in the saved settings
         if viewingIrText():
             cid = str(mw.reviewer.card.id)
 
             if cid not in self._settings['zoom']:
                 self._settings['zoom'][cid] = 1
 
-            self._settings['zoom'][cid] -= self._settings['zoomStep']
+            self._settings['zoom'][cid] = round(
+                self._settings['zoom'][cid] + step, 2
+            )
             mw.web.setZoomFactor(self._settings['zoom'][cid])
         elif mw.state == 'review':
-            self._zoomFactor -= self._settings['zoomStep']
+            self._zoomFactor = round(self._zoomFactor + step, 2)
             mw.web.setZoomFactor(self._zoomFactor)
         else:
-            self._settings['generalZoom'] -= self._settings['zoomStep']
+            self._settings['generalZoom'] = round(
+                self._settings['generalZoom'] + step, 2
+            )
             mw.web.setZoomFactor(self._settings['generalZoom'])
 
     def _setZoom(self, factor=None):
@@ -15,7 +15,7 @@ class SettingsTests(TestCase):
         patch.dict('sys.modules', modules).start()
         pf_mock = MagicMock(return_value=str())
         if_mock = MagicMock(return_value=True)
-        patch('ir.settings.json.load', MagicMock()).start()
+        patch('ir.settings.loadJson', MagicMock()).start()
         patch('ir.settings.mw.pm.profileFolder', pf_mock).start()
         patch('ir.settings.open', mock_open()).start()
         patch('ir.settings.os.path.isfile', if_mock).start()
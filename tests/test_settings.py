@@ -6,17 +6,53 @@ from . import SettingsTests
 class SaveTests(SettingsTests):
     def test_save(self):
         open_mock = mock_open()
-        dump_mock = MagicMock()
+        replace_mock = MagicMock()
         open_patcher = patch('ir.settings.open', open_mock)
-        dump_patcher = patch('ir.settings.json.dump', dump_mock)
+        replace_patcher = patch('ir.settings.os.replace', replace_mock)
+        fsync_patcher = patch('ir.settings.os.fsync', MagicMock())
         open_patcher.start()
-        dump_patcher.start()
+        replace_patcher.start()
+        fsync_mock = fsync_patcher.start()
         self.sm.getSettingsPath = MagicMock(return_value='foo.json')
         self.sm.settings = {'foo': 'bar'}
         self.sm.save()
-        open_mock.assert_called_once_with('foo.json', 'w', encoding='utf-8')
-        dump_mock.assert_called_once_with({'foo': 'bar'}, open_mock())
-        dump_patcher.stop()
+        open_mock.assert_called_once_with('foo.json.tmp', 'wb')
+        open_mock().write.assert_called_once_with(b'{"foo":"bar"}')
+        fsync_mock.assert_called_once_with(open_mock().fileno())
+        replace_mock.assert_called_once_with('foo.json.tmp', 'foo.json')
+
+    def test_save_failed(self):
+        open_mock = mock_open()
+        open_mock().write.side_effect = OSError
+        replace_mock = MagicMock()
+        remove_mock = MagicMock()
+        open_patcher = patch('ir.settings.open', open_mock)
+        replace_patcher = patch('ir.settings.os.replace', replace_mock)
+        exists_patcher = patch(
+            'ir.settings.os.path.exists', MagicMock(return_value=True)
+        )
+        remove_patcher = patch('ir.settings.os.remove', remove_mock)
+        open_patcher.start()
+        replace_patcher.start()
+        exists_patcher.start()
+        remove_patcher.start()
+        self.sm.getSettingsPath = MagicMock(return_value='foo.json')
+        self.sm.settings = {'foo': 'bar'}
+        with self.assertRaises(OSError):
+            self.sm.save()
+        replace_mock.assert_not_called()
+        remove_mock.assert_called_once_with('foo.json.tmp')
+        self.assertNotEqual(self.sm._savedJson, b'{"foo":"bar"}')
+
+    def test_save_unchanged(self):
+        open_mock = mock_open()
+        open_patcher = patch('ir.settings.open', open_mock)
+        open_patcher.start()
+        self.sm.getSettingsPath = MagicMock(return_value='foo.json')
+        self.sm.settings = {'foo': 'bar'}
+        self.sm._savedJson = b'{"foo":"bar"}'
+        self.sm.save()
+        open_mock.assert_not_called()
 
 
 class PathTests(SettingsTests):
@@ -30,6 +66,75 @@ class PathTests(SettingsTests):
         self.assertEqual(self.sm.getSettingsPath(), 'foo/_ir.json')
 
 
+class LoadTests(SettingsTests):
+    def test_loadDefaults(self):
+        with patch(
+            'ir.settings.os.path.isfile', MagicMock(return_value=False)
+        ):
+            self.sm.load()
+        self.assertEqual(self.sm.settings, self.sm.defaults)
+        self.sm.settings['quickKeys']['Ctrl+A'] = {}
+        self.assertEqual(self.sm.defaults['quickKeys'], {})
+
+
+class AddMissingTests(SettingsTests):
+    def test_addMissing(self):
+        self.sm.defaults = {'foo': 1, 'bar': 2}
+        self.sm.settings = {'foo': 3}
+        self.sm.updated = False
+        self.sm._addMissing()
+        self.assertEqual(self.sm.settings, {'foo': 3, 'bar': 2})
+        self.assertTrue(self.sm.updated)
+
+    def test_addMissingInDefaultsOrder(self):
+        self.sm.defaults = dict.fromkeys(['foo', 'bar', 'baz', 'qux', 'quux'])
+        self.sm.settings = {'baz': 1}
+        self.sm._addMissing()
+        self.assertEqual(
+            list(self.sm.settings), ['baz', 'foo', 'bar', 'qux', 'quux']
+        )
+
+    def test_nothingMissing(self):
+        self.sm.defaults = {'foo': 1}
+        self.sm.settings = {'foo': 3}
+        self.sm.updated = False
+        self.sm._addMissing()
+        self.assertEqual(self.sm.settings, {'foo': 3})
+        self.assertFalse(self.sm.updated)
+
+
+class RemoveOutdatedTests(SettingsTests):
+    def test_removeOutdated(self):
+        complete = dict.fromkeys(
+            [
+                'alt',
+                'ctrl',
+                'editExtract',
+                'editSource',
+                'extractBgColor',
+                'extractDeck',
+                'extractTextColor',
+                'isQuickKey',
+                'modelName',
+                'regularKey',
+                'shift',
+                'sourceField',
+                'tags',
+                'textField',
+            ]
+        )
+        incomplete = {'alt': False, 'ctrl': True}
+        self.sm.defaults = {'quickKeys': {}}
+        self.sm.settings = {
+            'quickKeys': {'Ctrl+A': complete, 'Ctrl+B': incomplete},
+            'foo': 'bar',
+        }
+        self.sm.updated = False
+        self.sm._removeOutdated()
+        self.assertEqual(self.sm.settings, {'quickKeys': {'Ctrl+A': complete}})
+        self.assertTrue(self.sm.updated)
+
+
 class ValidateFormatStringsTests(SettingsTests):
     def test_valid(self):
         self.sm.defaults = {